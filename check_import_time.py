@@ -0,0 +1,68 @@
+"""Check the headless import path against its startup budget.
+
+Runs ``python -X importtime -c "import <module>"`` in fresh interpreters and
+fails if tkinter is imported or the best cumulative import time of a module is
+over budget. A warm-up run writes bytecode first so source compilation is not
+counted.
+
+    python check_import_time.py [--budget-ms 25] [--runs 5] [module ...]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+HEADLESS_MODULES = ("maze_core", "MazeHW")
+
+
+def import_times(module):
+    """Import a module in a fresh interpreter; return {imported module name: cumulative microseconds}"""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=os.path.dirname(os.path.abspath(__file__)), env=env,
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def check_module(module, budget_ms, runs):
+    """Return a list of problems found for one module (empty when within budget)"""
+    import_times(module)  # Warm-up: compile and cache bytecode
+    samples = [import_times(module) for _ in range(runs)]
+
+    problems = []
+    gui_modules = sorted(name for name in samples[0] if name.split(".")[0] in ("tkinter", "_tkinter", "maze_gui"))
+    if gui_modules:
+        problems.append(f"{module} imports GUI modules: {', '.join(gui_modules)}")
+
+    best_ms = min(sample[module] for sample in samples) / 1000
+    print(f"{module}: {best_ms:.1f} ms (budget {budget_ms:.1f} ms)")
+    if best_ms > budget_ms:
+        problems.append(f"{module} took {best_ms:.1f} ms to import, over the {budget_ms:.1f} ms budget")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check headless import time")
+    parser.add_argument("modules", nargs="*", default=HEADLESS_MODULES)
+    parser.add_argument("--budget-ms", type=float, default=25.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    problems = []
+    for module in args.modules:
+        problems += check_module(module, args.budget_ms, args.runs)
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1314 @@
+"""Maze model and solvers.
+
+Importing this module must stay cheap: it does not load tkinter, and modules
+only some features need (hashlib, zlib, heapq, tempfile, sqlite3) are imported
+inside the functions that use them. check_import_time.py guards the budget.
+"""
+import time
+import threading
+import os
+import struct
+from array import array
+from bisect import bisect_right
+from collections import deque, OrderedDict
+from itertools import compress
+
+
+def _runs_from_positions(positions):
+    """Turn sorted wall positions into run boundaries (start, stop, start, stop, ...)"""
+    runs = []
+    for position in positions:
+        if runs and runs[-1] == position:
+            runs[-1] = position + 1
+        else:
+            runs += (position, position + 1)
+    return tuple(runs)
+
+
+def _runs_from_bytes(data):
+    """Turn a row of 0/1 wall bytes into run boundaries"""
+    runs = []
+    start = data.find(1)
+    while start != -1:
+        stop = data.find(0, start)
+        if stop == -1:
+            runs += (start, len(data))
+            break
+        runs += (start, stop)
+        start = data.find(1, stop)
+    return tuple(runs)
+
+
+def _runs_to_bytes(runs, length):
+    """Expand run boundaries into a row of 0/1 wall bytes"""
+    data = bytearray(length)
+    for start, stop in zip(runs[::2], runs[1::2]):
+        data[start:stop] = b'\x01' * (stop - start)
+    return bytes(data)
+
+
+def _runs_xor(runs, other):
+    """Return the runs of walls present in exactly one of two rows"""
+    return tuple(sorted(set(runs).symmetric_difference(other)))
+
+
+def _runs_length(runs):
+    """Count the walls covered by run boundaries"""
+    return sum(runs[1::2]) - sum(runs[::2])
+
+
+def _text_maze_cols(horizontal_width, vertical_width):
+    """Return the column count of a text maze from its widest horizontal and vertical wall lines
+
+    Element j of a wall line sits at character 2 * j, so a horizontal line
+    spans at most 2 * cols - 1 characters and a vertical line 2 * cols + 1.
+    Widths count trailing spaces but not line endings.
+    """
+    return max((horizontal_width + 1) // 2, (vertical_width - 1) // 2, 0)
+
+
+def _merge_row_groups(groups):
+    """Merge consecutive (runs, count) groups with equal runs, dropping empty ones"""
+    current, total = None, 0
+    for runs, count in groups:
+        if count <= 0:
+            continue
+        if total and runs == current:
+            total += count
+        else:
+            if total:
+                yield current, total
+            current, total = runs, count
+    if total:
+        yield current, total
+
+
+class _WallRowView:
+    def __init__(self, plane, row):
+        """Read-only row of a wall plane, so plane[row][col] reads work for every backend
+
+        Edits must go through Maze, which keeps snapshots, the version and the
+        content hash in step.
+        """
+        self.plane = plane
+        self.row = row
+
+    def __getitem__(self, col):
+        return self.plane.get(self.row, col)
+
+    def __len__(self):
+        return self.plane.n_cols
+
+    def __iter__(self):
+        return map(bool, self.plane.row_bytes(self.row))
+
+
+class DenseWallPlane:
+    name = "dense"
+
+    def __init__(self, n_rows, n_cols, rows=None):
+        """Wall plane stored as one list of booleans per row"""
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        self.rows = rows if rows is not None else [[False] * n_cols for _ in range(n_rows)]
+        # Rows flagged here are shared with a copy and must be copied before being edited
+        self._shared = bytearray(n_rows)
+
+    def __len__(self):
+        return self.n_rows
+
+    def __getitem__(self, row):
+        return _WallRowView(self, row)
+
+    def __iter__(self):
+        return (_WallRowView(self, row) for row in range(self.n_rows))
+
+    def get(self, row, col):
+        """Return whether there is a wall at (row, col)"""
+        return self.rows[row][col]
+
+    def set(self, row, col, value):
+        """Set the wall at (row, col), copying the row first if it is shared"""
+        if self._shared[row]:
+            self.rows[row] = list(self.rows[row])
+            self._shared[row] = 0
+        self.rows[row][col] = value
+
+    def toggle(self, row, col):
+        """Flip the wall at (row, col)"""
+        self.set(row, col, not self.rows[row][col])
+
+    def copy(self):
+        """Return a copy sharing every row; whichever side edits a row first copies it"""
+        plane = DenseWallPlane(self.n_rows, self.n_cols, list(self.rows))
+        plane._shared = bytearray(b'\x01') * self.n_rows
+        self._shared = bytearray(b'\x01') * self.n_rows
+        return plane
+
+    def row_bytes(self, row):
+        """Return a row as 0/1 bytes"""
+        return bytes(self.rows[row])
+
+    def row_runs(self, row):
+        """Return a row as run boundaries"""
+        return _runs_from_bytes(bytes(self.rows[row]))
+
+    def row_groups(self):
+        """Yield (runs, count) for each stretch of identical consecutive rows"""
+        return _merge_row_groups((self.row_runs(row), 1) for row in range(self.n_rows))
+
+    def tobytes(self):
+        """Return the whole plane as row-major 0/1 bytes"""
+        return b''.join(map(bytes, self.rows))
+
+
+class RLEWallPlane:
+    name = "rle"
+
+    def __init__(self, n_rows, n_cols, rows=None):
+        """Wall plane stored as run boundaries per row (start, stop, start, stop, ...)
+
+        Rows are immutable tuples, so copies share them freely and identical rows
+        are stored once.
+        """
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        self.rows = rows if rows is not None else [()] * n_rows
+
+    def __len__(self):
+        return self.n_rows
+
+    def __getitem__(self, row):
+        return _WallRowView(self, row)
+
+    def __iter__(self):
+        return (_WallRowView(self, row) for row in range(self.n_rows))
+
+    def get(self, row, col):
+        """Return whether there is a wall at (row, col)"""
+        return bisect_right(self.rows[row], col) % 2 == 1
+
+    def set(self, row, col, value):
+        """Set the wall at (row, col)"""
+        if self.get(row, col) != value:
+            self.toggle(row, col)
+
+    def toggle(self, row, col):
+        """Flip the wall at (row, col)"""
+        self.rows[row] = _runs_xor(self.rows[row], (col, col + 1))
+
+    def copy(self):
+        """Return a copy; rows are immutable so only the row list is copied"""
+        return RLEWallPlane(self.n_rows, self.n_cols, list(self.rows))
+
+    def row_bytes(self, row):
+        """Return a row as 0/1 bytes"""
+        return _runs_to_bytes(self.rows[row], self.n_cols)
+
+    def row_runs(self, row):
+        """Return a row as run boundaries"""
+        return self.rows[row]
+
+    def row_groups(self):
+        """Yield (runs, count) for each stretch of identical consecutive rows"""
+        return _merge_row_groups((runs, 1) for runs in self.rows)
+
+    def tobytes(self):
+        """Return the whole plane as row-major 0/1 bytes"""
+        return b''.join(self.row_bytes(row) for row in range(self.n_rows))
+
+
+class SparseWallPlane:
+    name = "sparse"
+
+    def __init__(self, n_rows, n_cols, border, toggled=None):
+        """Wall plane stored as the walls that differ from a plain border
+
+        border is "rows" for the horizontal plane (first and last rows walled) or
+        "cols" for the vertical plane (first and last columns walled). toggled maps
+        a row to the frozenset of columns that differ from that pattern.
+        """
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        self.border = border
+        self.toggled = toggled if toggled is not None else {}
+        if border == "rows":
+            self._edge_runs = (0, n_cols) if n_cols else ()
+        else:
+            self._edge_runs = _runs_from_positions(sorted({0, n_cols - 1})) if n_cols else ()
+
+    def __len__(self):
+        return self.n_rows
+
+    def __getitem__(self, row):
+        return _WallRowView(self, row)
+
+    def __iter__(self):
+        return (_WallRowView(self, row) for row in range(self.n_rows))
+
+    def base_runs(self, row):
+        """Return the border pattern of a row as run boundaries"""
+        if self.border == "rows" and 0 < row < self.n_rows - 1:
+            return ()
+        return self._edge_runs
+
+    def get(self, row, col):
+        """Return whether there is a wall at (row, col)"""
+        if self.border == "rows":
+            base = row == 0 or row == self.n_rows - 1
+        else:
+            base = col == 0 or col == self.n_cols - 1
+        return base != (col in self.toggled.get(row, ()))
+
+    def set(self, row, col, value):
+        """Set the wall at (row, col)"""
+        if self.get(row, col) != value:
+            self.toggle(row, col)
+
+    def toggle(self, row, col):
+        """Flip the wall at (row, col)"""
+        cols = self.toggled.get(row, frozenset()) ^ {col}
+        if cols:
+            self.toggled[row] = cols
+        else:
+            self.toggled.pop(row, None)
+
+    def copy(self):
+        """Return a copy; toggled rows are frozensets so only the mapping is copied"""
+        return SparseWallPlane(self.n_rows, self.n_cols, self.border, dict(self.toggled))
+
+    def row_bytes(self, row):
+        """Return a row as 0/1 bytes"""
+        return _runs_to_bytes(self.row_runs(row), self.n_cols)
+
+    def row_runs(self, row):
+        """Return a row as run boundaries"""
+        cols = self.toggled.get(row)
+        if not cols:
+            return self.base_runs(row)
+        return _runs_xor(self.base_runs(row), _runs_from_positions(sorted(cols)))
+
+    def row_groups(self):
+        """Yield (runs, count) for each stretch of identical consecutive rows
+
+        Only toggled and border rows are visited; the plain rows between them are
+        emitted as one group each.
+        """
+        special = set(self.toggled)
+        if self.border == "rows" and self.n_rows:
+            special.update((0, self.n_rows - 1))
+
+        def groups():
+            row = 0
+            for next_row in sorted(special):
+                yield self.base_runs(row), next_row - row
+                yield self.row_runs(next_row), 1
+                row = next_row + 1
+            yield self.base_runs(row), self.n_rows - row
+
+        return _merge_row_groups(groups())
+
+    def tobytes(self):
+        """Return the whole plane as row-major 0/1 bytes"""
+        return b''.join(self.row_bytes(row) for row in range(self.n_rows))
+
+
+def _wall_plane(backend, n_rows, n_cols, border, row_runs):
+    """Build a wall plane of the given backend from a list of per-row run boundaries"""
+    if backend == "dense":
+        return DenseWallPlane(n_rows, n_cols, [list(map(bool, _runs_to_bytes(runs, n_cols))) for runs in row_runs])
+    if backend == "rle":
+        interned = {}
+        return RLEWallPlane(n_rows, n_cols, [interned.setdefault(runs, runs) for runs in row_runs])
+    if backend == "sparse":
+        plane = SparseWallPlane(n_rows, n_cols, border)
+        for row, runs in enumerate(row_runs):
+            base = plane.base_runs(row)
+            if runs != base:
+                diff = _runs_xor(runs, base)
+                plane.toggled[row] = frozenset(col for start, stop in zip(diff[::2], diff[1::2])
+                                               for col in range(start, stop))
+        return plane
+    raise ValueError(f"Unknown wall backend: {backend}")
+
+
+class Maze:
+    # Wall backend selection: small mazes stay dense; larger ones use the sparse
+    # plane when few walls differ from the border, or run-length rows when walls
+    # come in long runs
+    DENSE_CELL_LIMIT = 1 << 16
+    SPARSE_MAX_DENSITY = 0.01
+    RLE_MAX_DENSITY = 0.1
+
+    def __init__(self, file_path=None):
+        """Initialize the maze from a file or create empty maze"""
+        self.horizontal_walls = DenseWallPlane(0, 0)  # (rows + 1) x cols, wall above each cell
+        self.vertical_walls = DenseWallPlane(0, 0)  # rows x (cols + 1), wall left of each cell
+        self.rows = 0
+        self.cols = 0
+        self.version = 0  # Bumped on every edit so solves on a snapshot can detect they are stale
+        self._hash_slot = [None]  # Content hash, shared with snapshots until either side is edited
+        self._entrance = None
+        self._exit = None
+
+        if file_path:
+            self.parse_maze_file(file_path)
+        else:
+            self.create_empty_maze(8, 8)  # Default size
+
+    def create_empty_maze(self, rows, cols, backend=None):
+        """Create an empty maze with given dimensions (backend: "dense", "rle", "sparse" or None for auto)"""
+        self.rows = rows
+        self.cols = cols
+
+        # Only border walls: top and bottom rows, left and right columns
+        border_row = (0, cols) if cols else ()
+        horizontal_runs = [border_row if i == 0 or i == rows else () for i in range(rows + 1)]
+        vertical_runs = [_runs_from_positions(sorted({0, cols}))] * rows
+
+        self.entrance = (0, 0)
+        self.exit = (rows - 1, cols - 1)
+        self._load_walls(horizontal_runs, vertical_runs, backend)
+
+    def parse_maze_file(self, file_path):
+        """Parse the maze text file and extract walls and coordinates"""
+        with open(file_path, 'r') as file:
+            self.parse_maze_text(file.read())
+
+    def parse_maze_text(self, text):
+        """Parse a maze given in the text file format"""
+        raw_lines = text.splitlines()
+        lines = [line.rstrip() for line in raw_lines]
+
+        # Find where the coordinates start
+        coord_start_idx = 0
+        for i, line in enumerate(lines):
+            if ',' in line:
+                coord_start_idx = i
+                break
+
+        wall_lines = lines[:coord_start_idx]
+
+        # Count the number of horizontal wall lines (should be rows + 1)
+        # Each pair of lines (horizontal, vertical) represents one row, plus the last horizontal line
+        self.rows = (len(wall_lines) + 1) // 2 - 1 if len(wall_lines) % 2 != 0 else len(wall_lines) // 2
+
+        # Walls are read by position (element j at character 2 * j), so gaps keep their columns.
+        # Widths include trailing spaces, which save_to_file writes for a right column with no walls.
+        raw_wall_lines = raw_lines[:coord_start_idx]
+        self.cols = _text_maze_cols(max(map(len, raw_wall_lines[0::2]), default=0),
+                                    max(map(len, raw_wall_lines[1::2]), default=0))
+
+        # Fallback if no wall lines provide column info (e.g., empty maze file)
+        if self.cols == 0 and self.rows > 0:
+            self.cols = 1  # A single column maze
+
+        # Parse walls into run boundaries per row; the backend is chosen once all rows are known
+        horizontal_runs = [()] * (self.rows + 1)
+        vertical_runs = [()] * self.rows
+        for i, line in enumerate(wall_lines):
+            if i % 2 == 0:  # Horizontal walls
+                horizontal_runs[i // 2] = _runs_from_positions(
+                    k // 2 for k in range(0, min(len(line), 2 * self.cols), 2) if line[k] == '-')
+            else:  # Vertical walls
+                vertical_runs[i // 2] = _runs_from_positions(
+                    k // 2 for k in range(0, min(len(line), 2 * self.cols + 2), 2) if line[k] == '|')
+
+        # Parse entrance and exit
+        entrance_line = lines[coord_start_idx].strip()
+        exit_line = lines[coord_start_idx + 1].strip()
+        self.entrance = tuple(map(int, entrance_line.split(',')))
+        self.exit = tuple(map(int, exit_line.split(',')))
+        self._load_walls(horizontal_runs, vertical_runs)
+
+    def choose_wall_backend(self, horizontal_runs, vertical_runs):
+        """Pick a wall backend from the size of the maze and the density of its walls"""
+        if self.rows * self.cols <= self.DENSE_CELL_LIMIT:
+            return "dense"
+
+        slots = (self.rows + 1) * self.cols + self.rows * (self.cols + 1)
+        boundaries = sum(map(len, horizontal_runs)) + sum(map(len, vertical_runs))
+
+        # Walls that differ from a plain border are what the sparse plane has to store
+        off_border = 0
+        for border, row_runs, n_cols in (("rows", horizontal_runs, self.cols), ("cols", vertical_runs, self.cols + 1)):
+            base_plane = SparseWallPlane(len(row_runs), n_cols, border)
+            for row, runs in enumerate(row_runs):
+                base = base_plane.base_runs(row)
+                if runs != base:
+                    off_border += _runs_length(_runs_xor(runs, base))
+
+        if off_border <= self.SPARSE_MAX_DENSITY * slots:
+            return "sparse"
+        if boundaries <= self.RLE_MAX_DENSITY * slots:
+            return "rle"
+        return "dense"
+
+    def _load_walls(self, horizontal_runs, vertical_runs, backend=None):
+        """Replace both wall planes, built from per-row run boundaries"""
+        if backend is None:
+            backend = self.choose_wall_backend(horizontal_runs, vertical_runs)
+        self.horizontal_walls = _wall_plane(backend, self.rows + 1, self.cols, "rows", horizontal_runs)
+        self.vertical_walls = _wall_plane(backend, self.rows, self.cols + 1, "cols", vertical_runs)
+        self._edited()
+
+    def set_wall_backend(self, backend=None):
+        """Convert the wall planes to another backend (None picks one from the current walls)"""
+        horizontal_runs = [self.horizontal_walls.row_runs(row) for row in range(self.rows + 1)]
+        vertical_runs = [self.vertical_walls.row_runs(row) for row in range(self.rows)]
+        self._load_walls(horizontal_runs, vertical_runs, backend)
+
+    def _edited(self):
+        """Record an edit: bump the version and stop sharing the content hash with snapshots"""
+        self.version += 1
+        self._hash_slot = [None]
+
+    def snapshot(self):
+        """Return a read-only copy that shares wall rows with this maze (copy-on-write)
+
+        Only the outer row containers are copied. Dense rows stay shared until this
+        maze edits one, at which point the edit goes to a private copy of that row;
+        run-length and sparse rows are immutable and simply replaced on edit.
+        """
+        snap = Maze.__new__(Maze)
+        snap.rows = self.rows
+        snap.cols = self.cols
+        snap._entrance = self._entrance
+        snap._exit = self._exit
+        snap.version = self.version
+        snap._hash_slot = self._hash_slot  # A hash computed on the snapshot is reused here
+        snap.horizontal_walls = self.horizontal_walls.copy()
+        snap.vertical_walls = self.vertical_walls.copy()
+        return snap
+
+    def toggle_horizontal_wall(self, row, col):
+        """Toggle the horizontal wall above cell (row, col) without touching snapshots"""
+        self.horizontal_walls.toggle(row, col)
+        self._edited()
+
+    def toggle_vertical_wall(self, row, col):
+        """Toggle the vertical wall left of cell (row, col) without touching snapshots"""
+        self.vertical_walls.toggle(row, col)
+        self._edited()
+
+    @property
+    def entrance(self):
+        return self._entrance
+
+    @entrance.setter
+    def entrance(self, cell):
+        self._entrance = cell
+        self._edited()
+
+    @property
+    def exit(self):
+        return self._exit
+
+    @exit.setter
+    def exit(self, cell):
+        self._exit = cell
+        self._edited()
+
+    def set_entrance(self, cell):
+        """Move the entrance to the given cell"""
+        self.entrance = cell
+
+    def set_exit(self, cell):
+        """Move the exit to the given cell"""
+        self.exit = cell
+
+    BINARY_HEADER = struct.Struct('<4sIIiiii')  # magic, rows, cols, entrance row/col, exit row/col
+    BINARY_MAGIC = b'MZB1'
+
+    def to_bytes(self):
+        """Encode the maze in the binary format: header, then one 0/1 byte per wall
+
+        Horizontal walls come first ((rows + 1) * cols bytes, row-major),
+        followed by vertical walls (rows * (cols + 1) bytes, row-major).
+        """
+        parts = [self.BINARY_HEADER.pack(self.BINARY_MAGIC, self.rows, self.cols,
+                                         self.entrance[0], self.entrance[1], self.exit[0], self.exit[1])]
+        parts.append(self.horizontal_walls.tobytes())
+        parts.append(self.vertical_walls.tobytes())
+        return b''.join(parts)
+
+    def parse_maze_bytes(self, data):
+        """Parse a maze encoded by to_bytes"""
+        if len(data) < self.BINARY_HEADER.size:
+            raise ValueError("Binary maze payload is shorter than its header")
+        magic, rows, cols, entrance_row, entrance_col, exit_row, exit_col = self.BINARY_HEADER.unpack_from(data)
+        if magic != self.BINARY_MAGIC:
+            raise ValueError("Not a binary maze payload")
+        offset = self.BINARY_HEADER.size
+        if len(data) != offset + (rows + 1) * cols + rows * (cols + 1):
+            raise ValueError("Binary maze payload has the wrong length")
+
+        self.rows = rows
+        self.cols = cols
+        horizontal_runs = []
+        for _ in range(rows + 1):
+            horizontal_runs.append(_runs_from_bytes(data[offset:offset + cols]))
+            offset += cols
+        vertical_runs = []
+        for _ in range(rows):
+            vertical_runs.append(_runs_from_bytes(data[offset:offset + cols + 1]))
+            offset += cols + 1
+        self.entrance = (entrance_row, entrance_col)
+        self.exit = (exit_row, exit_col)
+        self._load_walls(horizontal_runs, vertical_runs)
+
+    def content_hash(self):
+        """Return a hash of the wall planes, entrance and exit (recomputed only after edits)
+
+        Rows are hashed as run boundaries, with repeated consecutive rows hashed once
+        and a count, so the hash does not depend on the wall backend. The hash is
+        stored in a slot shared with unedited snapshots, so a solve on a snapshot
+        also caches the hash for this maze.
+        """
+        if self._hash_slot[0] is None:
+            import hashlib
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(f"{self.rows}x{self.cols}:{self.entrance}:{self.exit};".encode())
+            for plane in (self.horizontal_walls, self.vertical_walls):
+                for runs, count in plane.row_groups():
+                    digest.update(struct.pack('<II', count, len(runs)))
+                    digest.update(array('q', runs).tobytes())
+            self._hash_slot[0] = digest.hexdigest()
+        return self._hash_slot[0]
+
+    def has_wall_between(self, cell1, cell2):
+        """Check if there is a wall between two adjacent cells"""
+        row1, col1 = cell1
+        row2, col2 = cell2
+
+        # Check if cells are adjacent
+        if abs(row1 - row2) + abs(col1 - col2) != 1:
+            return True  # Not adjacent cells
+
+        # Check horizontal walls
+        if row1 + 1 == row2:  # cell2 is below cell1
+            return self.horizontal_walls.get(row1 + 1, col1)
+        elif row2 + 1 == row1:  # cell2 is above cell1
+            return self.horizontal_walls.get(row1, col1)
+
+        # Check vertical walls
+        if col1 + 1 == col2:  # cell2 is to the right of cell1
+            return self.vertical_walls.get(row1, col1 + 1)
+        elif col2 + 1 == col1:  # cell2 is to the left of cell1
+            return self.vertical_walls.get(row1, col1)
+
+        return False
+
+    def get_valid_moves(self, cell):
+        """Get all valid moves from the current cell (up, left, down, right)"""
+        row, col = cell
+        possible_moves = []
+
+        # Check in the specific order: up, left, down, right (as specified in the assignment)
+        directions = [(-1, 0), (0, -1), (1, 0), (0, 1)]
+        direction_names = ["up", "left", "down", "right"]
+
+        for (dr, dc), direction in zip(directions, direction_names):
+            new_row, new_col = row + dr, col + dc
+
+            # Check if the new position is within the maze boundaries
+            if 0 <= new_row < self.rows and 0 <= new_col < self.cols:
+                # Check if there's no wall between the current cell and the new cell
+                if not self.has_wall_between((row, col), (new_row, new_col)):
+                    possible_moves.append(((new_row, new_col), direction))
+
+        return possible_moves
+
+    def is_exit(self, cell):
+        """Check if the cell is the exit"""
+        return cell == self._exit
+
+    def save_to_file(self, file_path):
+        """Save the maze to a text file in the required format"""
+        with open(file_path, 'w') as file:
+            # Write horizontal walls (rows + 1 lines)
+            for i in range(self.rows + 1):
+                line_elements = ["-" if wall else " " for wall in self.horizontal_walls.row_bytes(i)]
+                file.write(" ".join(line_elements) + "\n")
+
+                # Write vertical walls for the current row (rows lines)
+                if i < self.rows:
+                    line_elements = ["|" if wall else " " for wall in self.vertical_walls.row_bytes(i)]
+                    file.write(" ".join(line_elements) + "\n")
+
+            # Write entrance and exit coordinates
+            file.write(f"{self.entrance[0]},{self.entrance[1]}\n")
+            file.write(f"{self.exit[0]},{self.exit[1]}\n")
+
+
+class MazeSolver:
+    FAST_CELL_LIMIT = 1 << 26  # Larger mazes use the tuple solvers, which only touch cells they reach
+
+    def __init__(self, maze, cache=None, fast=False):
+        """Initialize the maze solver with a maze object and an optional SolveCache
+
+        fast=True runs the integer-indexed kernels, which give the same results
+        as the tuple-based solvers several times faster.
+        """
+        self.maze = maze
+        self.cache = cache
+        self.fast = fast
+        self.cache_hit = False
+        self.path = []
+        self.visited = set()
+        self.steps_taken = 0
+        self.exploration_order = []  # For step-by-step visualization
+        self.solve_time = 0.0
+
+    @property
+    def visited(self):
+        """Cells explored by the last solve; fast solves decode them from a bitmap on first use"""
+        if self._visited is None:
+            bitmap, cols = self._visited_bitmap
+            self._visited = {divmod(cell, cols) for cell in compress(range(len(bitmap)), bitmap)}
+            self._visited_bitmap = None
+        return self._visited
+
+    @visited.setter
+    def visited(self, cells):
+        self._visited = cells
+        self._visited_bitmap = None
+
+    def _solve_cached(self, algorithm, solve):
+        """Return a cached result for this maze if there is one, otherwise solve and store it"""
+        start_time = time.time()
+        key = self.cache.make_key(self.maze, algorithm)
+        cached = self.cache.get(key)
+        if cached is not None:
+            path, self.steps_taken, _ = cached
+            self.path = list(path)
+            self.visited = set()
+            self.exploration_order = []
+            self.cache_hit = True
+            self.solve_time = time.time() - start_time
+            return bool(self.path)
+
+        self.cache_hit = False
+        found = solve()
+        self.cache.put(key, self.path, self.steps_taken, self.solve_time)
+        return found
+
+    def dfs(self, step_by_step=False):
+        """Find a path using Depth-First Search (LIFO stack)"""
+        # Step-by-step runs need the exploration order, which the cache does not keep
+        solve = self._dfs_fast if self.fast else self._dfs
+        if self.cache is not None and not step_by_step:
+            return self._solve_cached("dfs", solve)
+        return solve(step_by_step)
+
+    def _dfs(self, step_by_step=False):
+        start_time = time.time()
+        self.visited = set()
+        self.path = []
+        self.steps_taken = 0
+        self.exploration_order = []
+
+        stack = [(self.maze.entrance, [])]
+
+        while stack:
+            current, path = stack.pop()  # LIFO
+            self.steps_taken += 1
+
+            if current in self.visited:
+                continue
+
+            self.visited.add(current)
+            if step_by_step:
+                self.exploration_order.append(('visit', current))
+
+            if self.maze.is_exit(current):
+                self.path = path + [current]
+                self.solve_time = time.time() - start_time
+                return True
+
+            valid_moves = self.maze.get_valid_moves(current)
+            valid_moves.reverse()  # For correct order when using stack (pop simulates DFS LIFO)
+
+            for next_cell, _ in valid_moves:
+                if next_cell not in self.visited:
+                    stack.append((next_cell, path + [current]))
+                    if step_by_step:
+                        self.exploration_order.append(('explore', next_cell))
+
+        self.solve_time = time.time() - start_time
+        return False
+
+    def bfs(self, step_by_step=False):
+        """Find a path using Breadth-First Search (FIFO queue)"""
+        solve = self._bfs_fast if self.fast else self._bfs
+        if self.cache is not None and not step_by_step:
+            return self._solve_cached("bfs", solve)
+        return solve(step_by_step)
+
+    def _bfs(self, step_by_step=False):
+        start_time = time.time()
+        self.visited = set()
+        self.path = []
+        self.steps_taken = 0
+        self.exploration_order = []
+
+        queue = deque([(self.maze.entrance, [])])
+
+        while queue:
+            current, path = queue.popleft()  # FIFO
+            self.steps_taken += 1
+
+            if current in self.visited:
+                continue
+
+            self.visited.add(current)
+            if step_by_step:
+                self.exploration_order.append(('visit', current))
+
+            if self.maze.is_exit(current):
+                self.path = path + [current]
+                self.solve_time = time.time() - start_time
+                return True
+
+            valid_moves = self.maze.get_valid_moves(current)
+
+            for next_cell, _ in valid_moves:
+                if next_cell not in self.visited:
+                    queue.append((next_cell, path + [current]))
+                    if step_by_step:
+                        self.exploration_order.append(('explore', next_cell))
+
+        self.solve_time = time.time() - start_time
+        return False
+
+    def _kernel_setup(self):
+        """Flatten the maze for the integer kernels, or return None if it needs the tuple solvers
+
+        Cell (row, col) becomes id row * cols + col. blocked[id] has bit 1, 2, 4
+        or 8 set when the move up, left, down or right is closed by a wall or the
+        grid edge. The bytes are combined as big integers so no Python loop runs
+        per cell. Run-length and sparse planes, and mazes over FAST_CELL_LIMIT
+        cells, are left to the tuple solvers because flattening them would
+        allocate the whole grid.
+        """
+        maze = self.maze
+        rows, cols = maze.rows, maze.cols
+        if rows <= 0 or cols <= 0 or rows * cols > self.FAST_CELL_LIMIT:
+            return None
+        if not (isinstance(maze.horizontal_walls, DenseWallPlane) and isinstance(maze.vertical_walls, DenseWallPlane)):
+            return None
+        entrance_row, entrance_col = maze.entrance
+        if not (0 <= entrance_row < rows and 0 <= entrance_col < cols):
+            return None
+
+        cell_count = rows * cols
+        horizontal = maze.horizontal_walls.tobytes()
+        vertical = maze.vertical_walls.tobytes()
+        edge = b'\x01' * cols
+        inner_vertical = [vertical[offset + 1:offset + cols] for offset in range(0, rows * (cols + 1), cols + 1)]
+        up = int.from_bytes(edge + horizontal[cols:cell_count], 'little')
+        down = int.from_bytes(horizontal[cols:cell_count] + edge, 'little')
+        left = int.from_bytes(b''.join(b'\x01' + walls for walls in inner_vertical), 'little')
+        right = int.from_bytes(b''.join(walls + b'\x01' for walls in inner_vertical), 'little')
+        blocked = (up | left << 1 | down << 2 | right << 3).to_bytes(cell_count, 'little')
+
+        exit_row, exit_col = maze.exit
+        goal = exit_row * cols + exit_col if 0 <= exit_row < rows and 0 <= exit_col < cols else -1
+        typecode = 'i' if cell_count < 2 ** 31 else 'q'  # Cell ids must fit the arrays holding them
+        return cols, cell_count, blocked, entrance_row * cols + entrance_col, goal, typecode
+
+    def _finish_fast(self, found, visited, parent, goal, cols, steps, start_time):
+        """Convert kernel state back to the (row, col) results the tuple solvers produce"""
+        self.steps_taken = steps
+        if found:
+            path = []
+            cell = goal
+            while cell != -1:
+                path.append(divmod(cell, cols))
+                cell = parent[cell]
+            path.reverse()
+            self.path = path
+
+        self._visited = None  # Decoded by the visited property only if someone reads it
+        self._visited_bitmap = (visited, cols)
+        self.solve_time = time.time() - start_time
+        return found
+
+    def _dfs_fast(self, step_by_step=False):
+        """DFS over flat cell ids; same visit order, path and step count as _dfs"""
+        start_time = time.time()
+        self.visited = set()
+        self.path = []
+        self.steps_taken = 0
+        self.exploration_order = []
+
+        kernel = self._kernel_setup()
+        if kernel is None:
+            return self._dfs(step_by_step)
+        cols, cell_count, blocked, start, goal, typecode = kernel
+        order = self.exploration_order
+
+        visited = bytearray(cell_count)
+        parent = array(typecode, [-1]) * cell_count
+        stack = array(typecode, (start, -1))  # Flat (cell, parent) pairs
+        pop = stack.pop
+        push = stack.append
+        steps = 0
+
+        while stack:
+            from_cell = pop()
+            cell = pop()
+            steps += 1
+
+            if visited[cell]:
+                continue
+
+            visited[cell] = 1
+            parent[cell] = from_cell
+            if step_by_step:
+                order.append(('visit', divmod(cell, cols)))
+
+            if cell == goal:
+                return self._finish_fast(True, visited, parent, goal, cols, steps, start_time)
+
+            # Push right, down, left, up so they pop as up, left, down, right
+            walls = blocked[cell]
+            if not walls & 8 and not visited[cell + 1]:
+                push(cell + 1)
+                push(cell)
+                if step_by_step:
+                    order.append(('explore', divmod(cell + 1, cols)))
+            if not walls & 4 and not visited[cell + cols]:
+                push(cell + cols)
+                push(cell)
+                if step_by_step:
+                    order.append(('explore', divmod(cell + cols, cols)))
+            if not walls & 2 and not visited[cell - 1]:
+                push(cell - 1)
+                push(cell)
+                if step_by_step:
+                    order.append(('explore', divmod(cell - 1, cols)))
+            if not walls & 1 and not visited[cell - cols]:
+                push(cell - cols)
+                push(cell)
+                if step_by_step:
+                    order.append(('explore', divmod(cell - cols, cols)))
+
+        return self._finish_fast(False, visited, parent, goal, cols, steps, start_time)
+
+    def _bfs_fast(self, step_by_step=False):
+        """BFS over flat cell ids with a ring-buffer queue; same results as _bfs"""
+        start_time = time.time()
+        self.visited = set()
+        self.path = []
+        self.steps_taken = 0
+        self.exploration_order = []
+
+        kernel = self._kernel_setup()
+        if kernel is None:
+            return self._bfs(step_by_step)
+        cols, cell_count, blocked, start, goal, typecode = kernel
+        order = self.exploration_order
+
+        visited = bytearray(cell_count)
+        parent = array(typecode, [-1]) * cell_count
+        capacity = 1024  # Ring-buffer slots; always a power of two
+        queue = array(typecode, [0]) * capacity  # Queued cells
+        queue_parent = array(typecode, [0]) * capacity  # Cell that queued each entry
+        queue[0] = start
+        queue_parent[0] = -1
+        mask = capacity - 1
+        head = 0
+        size = 1
+        steps = 0
+
+        while size:
+            cell = queue[head]
+            from_cell = queue_parent[head]
+            head = (head + 1) & mask
+            size -= 1
+            steps += 1
+
+            if visited[cell]:
+                continue
+
+            visited[cell] = 1
+            parent[cell] = from_cell
+            if step_by_step:
+                order.append(('visit', divmod(cell, cols)))
+
+            if cell == goal:
+                return self._finish_fast(True, visited, parent, goal, cols, steps, start_time)
+
+            if size + 4 > capacity:
+                # Unroll the ring so live entries start at slot 0, then double it
+                queue = queue[head:] + queue[:head]
+                queue_parent = queue_parent[head:] + queue_parent[:head]
+                queue.extend(array(typecode, [0]) * capacity)
+                queue_parent.extend(array(typecode, [0]) * capacity)
+                head = 0
+                capacity *= 2
+                mask = capacity - 1
+            tail = (head + size) & mask
+
+            # Enqueue in the up, left, down, right order of get_valid_moves
+            walls = blocked[cell]
+            if not walls & 1 and not visited[cell - cols]:
+                queue[tail] = cell - cols
+                queue_parent[tail] = cell
+                tail = (tail + 1) & mask
+                size += 1
+                if step_by_step:
+                    order.append(('explore', divmod(cell - cols, cols)))
+            if not walls & 2 and not visited[cell - 1]:
+                queue[tail] = cell - 1
+                queue_parent[tail] = cell
+                tail = (tail + 1) & mask
+                size += 1
+                if step_by_step:
+                    order.append(('explore', divmod(cell - 1, cols)))
+            if not walls & 4 and not visited[cell + cols]:
+                queue[tail] = cell + cols
+                queue_parent[tail] = cell
+                tail = (tail + 1) & mask
+                size += 1
+                if step_by_step:
+                    order.append(('explore', divmod(cell + cols, cols)))
+            if not walls & 8 and not visited[cell + 1]:
+                queue[tail] = cell + 1
+                queue_parent[tail] = cell
+                tail = (tail + 1) & mask
+                size += 1
+                if step_by_step:
+                    order.append(('explore', divmod(cell + 1, cols)))
+
+        return self._finish_fast(False, visited, parent, goal, cols, steps, start_time)
+
+    def get_path_length(self):
+        """Return the length of the discovered path"""
+        if not self.path:
+            return 0
+        return len(self.path) - 1
+
+
+class SolveCache:
+    MOVE_CODES = {(-1, 0): b'U', (0, -1): b'L', (1, 0): b'D', (0, 1): b'R'}
+    MOVE_OFFSETS = {ord('U'): (-1, 0), ord('L'): (0, -1), ord('D'): (1, 0), ord('R'): (0, 1)}
+    HEADER = struct.Struct('<qdqq')  # steps_taken, solve_time, start row, start col
+
+    def __init__(self, capacity=256, cache_dir=None):
+        """Initialize an LRU cache of solve results, optionally backed by a SQLite file in cache_dir"""
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (path tuple, steps_taken, solve_time)
+        self._lock = threading.Lock()  # Solves run on worker threads
+        self._db = None
+
+        if cache_dir:
+            import sqlite3  # Only needed for the on-disk tier
+            os.makedirs(cache_dir, exist_ok=True)
+            self._db = sqlite3.connect(os.path.join(cache_dir, "solve_cache.sqlite3"), check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB)")
+            self._db.commit()
+
+    @staticmethod
+    def make_key(maze, algorithm):
+        """Build the cache key for solving a maze with the given algorithm"""
+        return f"{algorithm}:{maze.content_hash()}"
+
+    def _encode(self, path, steps_taken, solve_time):
+        """Pack a result as the start cell plus one move letter per step, zlib-compressed"""
+        import zlib
+        start = path[0] if path else (-1, -1)
+        moves = b''.join(self.MOVE_CODES[(r2 - r1, c2 - c1)] for (r1, c1), (r2, c2) in zip(path, path[1:]))
+        return zlib.compress(self.HEADER.pack(steps_taken, solve_time, start[0], start[1]) + moves)
+
+    def _decode(self, blob):
+        """Unpack a result written by _encode"""
+        import zlib
+        data = zlib.decompress(blob)
+        steps_taken, solve_time, row, col = self.HEADER.unpack_from(data)
+        if row < 0:
+            return (), steps_taken, solve_time
+        path = [(row, col)]
+        for move in data[self.HEADER.size:]:
+            dr, dc = self.MOVE_OFFSETS[move]
+            row, col = row + dr, col + dc
+            path.append((row, col))
+        return tuple(path), steps_taken, solve_time
+
+    def get(self, key):
+        """Return (path, steps_taken, solve_time) for a key, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+            if self._db is not None:
+                row = self._db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    entry = self._decode(row[0])
+                    self._remember(key, entry)
+                    self.hits += 1
+                    return entry
+
+            self.misses += 1
+            return None
+
+    def put(self, key, path, steps_taken, solve_time):
+        """Store a solve result in memory and, if enabled, on disk"""
+        entry = (tuple(path), steps_taken, solve_time)
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+                                 (key, self._encode(path, steps_taken, solve_time)))
+                self._db.commit()
+
+    def _remember(self, key, entry):
+        """Insert into the in-memory tier, evicting the least recently used entry when full"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def stats_text(self):
+        """Return a one-line hit/miss summary for display"""
+        return f"Cache: {self.hits} hits, {self.misses} misses"
+
+    def close(self):
+        """Close the on-disk tier"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+class MazeFileReader:
+    def __init__(self, file_path):
+        """Index a saved maze file so wall rows can be read in bands without loading the whole maze"""
+        self.file_path = file_path
+        self.rows = 0
+        self.cols = 0
+        self.entrance = None
+        self.exit = None
+        self.line_offsets = array('q')  # Byte offset of every wall line, plus the end of the last one
+
+        coord_lines = []
+        widths = [0, 0]  # Widest horizontal and vertical wall line
+        offset = 0
+        with open(file_path, 'rb') as file:
+            for line in file:
+                if coord_lines or b',' in line:
+                    coord_lines.append(line.strip())
+                    if len(coord_lines) == 2:
+                        break
+                    continue
+                parity = len(self.line_offsets) % 2
+                widths[parity] = max(widths[parity], len(line.rstrip(b'\r\n')))
+                self.line_offsets.append(offset)
+                offset += len(line)
+        self.line_offsets.append(offset)
+
+        # Same row/column rules as Maze.parse_maze_text
+        wall_line_count = len(self.line_offsets) - 1
+        self.rows = (wall_line_count + 1) // 2 - 1 if wall_line_count % 2 != 0 else wall_line_count // 2
+        self.cols = _text_maze_cols(*widths)
+        if self.cols == 0 and self.rows > 0:
+            self.cols = 1
+
+        self.entrance = tuple(map(int, coord_lines[0].split(b',')))
+        self.exit = tuple(map(int, coord_lines[1].split(b',')))
+
+    def read_rows(self, start_row, stop_row):
+        """Read the walls of rows [start_row, stop_row) with one sequential read.
+
+        Returns (horizontal_lines, vertical_lines) where horizontal_lines holds the
+        lines above each row plus the one below the last row. Walls are decoded by
+        position (element j sits at character 2*j), the layout save_to_file writes.
+        """
+        first_line = 2 * start_row
+        last_line = min(2 * stop_row, len(self.line_offsets) - 2)
+        with open(self.file_path, 'rb') as file:
+            file.seek(self.line_offsets[first_line])
+            data = file.read(self.line_offsets[last_line + 1] - self.line_offsets[first_line])
+        lines = data.split(b'\n')
+        return lines[0:last_line - first_line + 1:2], lines[1:last_line - first_line + 1:2]
+
+
+class ExternalMazeSolver:
+    READ_BLOCK = 1 << 14  # Cell ids read per block when streaming layer/run files
+
+    def __init__(self, file_path, work_dir=None, band_rows=256, run_size=1 << 20):
+        """Initialize an out-of-core BFS solver over a maze file saved by Maze.save_to_file"""
+        self.reader = MazeFileReader(file_path)
+        self.work_dir = work_dir
+        self.band_rows = band_rows
+        self.run_size = run_size  # Max cell ids held in memory before a sorted run is spilled to disk
+        self.path = []
+        self.steps_taken = 0
+        self.layer_count = 0
+        self.solve_time = 0.0
+
+        self._band_start = None
+        self._band = None
+
+    def _walls(self, row):
+        """Return (above, vertical, below) wall lines for a row, loading its band if needed"""
+        if self._band_start is None or not self._band_start <= row < self._band_start + self.band_rows:
+            self._band_start = row - row % self.band_rows
+            stop = min(self._band_start + self.band_rows, self.reader.rows)
+            self._band = self.reader.read_rows(self._band_start, stop)
+        horizontal_lines, vertical_lines = self._band
+        i = row - self._band_start
+        return horizontal_lines[i], vertical_lines[i], horizontal_lines[i + 1]
+
+    def _open_neighbors(self, cell_id):
+        """Yield ids of neighbours reachable from cell_id (up, left, down, right)"""
+        cols = self.reader.cols
+        row, col = divmod(cell_id, cols)
+        above, vertical, below = self._walls(row)
+        k = 2 * col
+        if row > 0 and above[k:k + 1] != b'-':
+            yield cell_id - cols
+        if col > 0 and vertical[k:k + 1] != b'|':
+            yield cell_id - 1
+        if row < self.reader.rows - 1 and below[k:k + 1] != b'-':
+            yield cell_id + cols
+        if col < cols - 1 and vertical[k + 2:k + 3] != b'|':
+            yield cell_id + 1
+
+    def _read_ids(self, file_path):
+        """Stream cell ids from a binary id file in blocks"""
+        with open(file_path, 'rb') as file:
+            while True:
+                block = array('q')
+                try:
+                    block.fromfile(file, self.READ_BLOCK)
+                except EOFError:
+                    pass  # Partial last block; fromfile keeps what it read
+                if not block:
+                    return
+                yield from block
+
+    def _write_run(self, ids, run_paths, work_dir):
+        """Sort a buffer of cell ids and spill it to disk as one sorted run"""
+        run_path = os.path.join(work_dir, f"run{len(run_paths)}.bin")
+        with open(run_path, 'wb') as file:
+            array('q', sorted(ids)).tofile(file)
+        run_paths.append(run_path)
+
+    def _expand_layer(self, layer_path, prev_path, next_path, work_dir, exit_id):
+        """Build the next BFS layer file from the current one; return (cell count, exit reached)"""
+        import heapq
+        run_paths = []
+        buffer = array('q')
+        for cell_id in self._read_ids(layer_path):
+            self.steps_taken += 1
+            buffer.extend(self._open_neighbors(cell_id))
+            if len(buffer) >= self.run_size:
+                self._write_run(buffer, run_paths, work_dir)
+                buffer = array('q')
+        if buffer:
+            self._write_run(buffer, run_paths, work_dir)
+
+        # Merge the sorted runs, drop duplicates and anything already in the current or previous layer.
+        # On an undirected grid those two layers are the only ones a new neighbour can belong to.
+        seen_streams = [self._read_ids(layer_path)]
+        if prev_path:
+            seen_streams.append(self._read_ids(prev_path))
+        seen = heapq.merge(*seen_streams)
+        seen_id = next(seen, None)
+
+        count = 0
+        found = False
+        last_id = None
+        out = array('q')
+        with open(next_path, 'wb') as file:
+            for cell_id in heapq.merge(*(self._read_ids(path) for path in run_paths)):
+                if cell_id == last_id:
+                    continue
+                last_id = cell_id
+                while seen_id is not None and seen_id < cell_id:
+                    seen_id = next(seen, None)
+                if seen_id == cell_id:
+                    continue
+                out.append(cell_id)
+                count += 1
+                if cell_id == exit_id:
+                    found = True
+                if len(out) >= self.READ_BLOCK:
+                    out.tofile(file)
+                    out = array('q')
+            out.tofile(file)
+
+        for path in run_paths:
+            os.remove(path)
+        return count, found
+
+    def _layer_contains(self, layer_path, cell_id):
+        """Binary search a sorted layer file for a cell id"""
+        with open(layer_path, 'rb') as file:
+            lo, hi = 0, os.path.getsize(layer_path) // 8
+            while lo < hi:
+                mid = (lo + hi) // 2
+                file.seek(mid * 8)
+                value = array('q', file.read(8))[0]
+                if value < cell_id:
+                    lo = mid + 1
+                elif value > cell_id:
+                    hi = mid
+                else:
+                    return True
+        return False
+
+    def solve(self):
+        """Find a shortest path with external-memory BFS; layers live in sorted files on disk"""
+        import tempfile
+        start_time = time.time()
+        self.path = []
+        self.steps_taken = 0
+        self.layer_count = 0
+        self._band_start = None
+
+        cols = self.reader.cols
+        start_id = self.reader.entrance[0] * cols + self.reader.entrance[1]
+        exit_id = self.reader.exit[0] * cols + self.reader.exit[1]
+
+        with tempfile.TemporaryDirectory(dir=self.work_dir) as work_dir:
+            layer_paths = [os.path.join(work_dir, "layer0.bin")]
+            with open(layer_paths[0], 'wb') as file:
+                array('q', [start_id]).tofile(file)
+
+            found = start_id == exit_id
+            while not found:
+                prev_path = layer_paths[-2] if len(layer_paths) > 1 else None
+                next_path = os.path.join(work_dir, f"layer{len(layer_paths)}.bin")
+                count, found = self._expand_layer(layer_paths[-1], prev_path, next_path, work_dir, exit_id)
+                layer_paths.append(next_path)
+                if count == 0:
+                    self.layer_count = len(layer_paths)
+                    self.solve_time = time.time() - start_time
+                    return False
+
+            self.layer_count = len(layer_paths)
+
+            # Walk back from the exit, picking a neighbour in each earlier layer
+            path_ids = [exit_id]
+            for layer_path in reversed(layer_paths[:-1]):
+                for cell_id in self._open_neighbors(path_ids[-1]):
+                    if self._layer_contains(layer_path, cell_id):
+                        path_ids.append(cell_id)
+                        break
+
+        self.path = [divmod(cell_id, cols) for cell_id in reversed(path_ids)]
+        self.solve_time = time.time() - start_time
+        return True
+
+    def get_path_length(self):
+        """Return the length of the discovered path"""
+        if not self.path:
+            return 0
+        return len(self.path) - 1
@@ -0,0 +1,673 @@
+"""Tkinter front end for the maze solver"""
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+import os
+import threading
+
+from maze_core import Maze, MazeSolver, SolveCache
+from maze_profiler import UIProfiler, profiled
+
+
+class MazeVisualizer:
+    def __init__(self, master):
+        self.master = master
+        self.master.title("Maze Solver Visualization")
+        self.master.geometry("1200x800")
+
+        self.maze = None
+        self.solver = None
+        # Set MAZE_SOLVE_CACHE_DIR to keep solve results across sessions
+        self.solve_cache = SolveCache(cache_dir=os.environ.get("MAZE_SOLVE_CACHE_DIR"))
+        self.profiler = UIProfiler()
+        self.cell_size = 30
+        self.animation_speed = 100  # ms between steps
+        self.is_editing = False
+        self.edit_mode = "wall"  # "wall", "entrance", "exit"
+
+        self.animation_thread = None  # To hold the animation thread
+        self.animation_stop_event = threading.Event()  # Event to signal stopping animation
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Setup the user interface"""
+        # Main frame
+        main_frame = ttk.Frame(self.master)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        # Control panel
+        control_frame = ttk.Frame(main_frame)
+        control_frame.pack(fill=tk.X, pady=(0, 10))
+
+        # File operations
+        file_frame = ttk.LabelFrame(control_frame, text="File Operations")
+        file_frame.pack(fill=tk.X, pady=(0, 5))
+
+        ttk.Button(file_frame, text="Load Maze", command=self.load_maze).pack(side=tk.LEFT, padx=5)
+        ttk.Button(file_frame, text="Save Maze", command=self.save_maze).pack(side=tk.LEFT, padx=5)
+        ttk.Button(file_frame, text="New Maze", command=self.create_new_maze).pack(side=tk.LEFT, padx=5)
+
+        # Algorithm controls
+        algo_frame = ttk.LabelFrame(control_frame, text="Algorithm Controls")
+        algo_frame.pack(fill=tk.X, pady=(0, 5))
+
+        ttk.Button(algo_frame, text="Solve DFS", command=self.solve_dfs_threaded).pack(side=tk.LEFT, padx=5)
+        ttk.Button(algo_frame, text="Solve BFS", command=self.solve_bfs_threaded).pack(side=tk.LEFT, padx=5)
+        ttk.Button(algo_frame, text="Compare Both", command=self.compare_algorithms_threaded).pack(side=tk.LEFT, padx=5)
+        ttk.Button(algo_frame, text="Clear Solution", command=self.clear_solution).pack(side=tk.LEFT, padx=5)
+
+        # Animation controls
+        anim_frame = ttk.LabelFrame(control_frame, text="Animation Controls")
+        anim_frame.pack(fill=tk.X, pady=(0, 5))
+
+        ttk.Button(anim_frame, text="Step-by-Step DFS", command=self.animate_dfs).pack(side=tk.LEFT, padx=5)
+        ttk.Button(anim_frame, text="Step-by-Step BFS", command=self.animate_bfs).pack(side=tk.LEFT, padx=5)
+        ttk.Button(anim_frame, text="Stop Animation", command=self.stop_animation).pack(side=tk.LEFT,
+                                                                                        padx=5)  # New Stop Button
+
+        ttk.Label(anim_frame, text="Speed (ms):").pack(side=tk.LEFT, padx=(20, 0))
+        self.speed_var = tk.IntVar(value=100)
+        speed_scale = ttk.Scale(anim_frame, from_=10, to=500, variable=self.speed_var, orient=tk.HORIZONTAL)
+        speed_scale.pack(side=tk.LEFT, padx=5)
+
+        # Editing controls
+        edit_frame = ttk.LabelFrame(control_frame, text="Maze Editor")
+        edit_frame.pack(fill=tk.X, pady=(0, 5))
+
+        self.edit_var = tk.BooleanVar()
+        ttk.Checkbutton(edit_frame, text="Edit Mode", variable=self.edit_var,
+                        command=self.toggle_edit_mode).pack(side=tk.LEFT, padx=5)
+
+        self.mode_var = tk.StringVar(value="wall")
+        ttk.Radiobutton(edit_frame, text="Walls", variable=self.mode_var,
+                        value="wall").pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(edit_frame, text="Entrance", variable=self.mode_var,
+                        value="entrance").pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(edit_frame, text="Exit", variable=self.mode_var,
+                        value="exit").pack(side=tk.LEFT, padx=5)
+
+        # Profiling controls
+        profile_frame = ttk.LabelFrame(control_frame, text="Profiling")
+        profile_frame.pack(fill=tk.X, pady=(0, 5))
+
+        self.profile_var = tk.BooleanVar()
+        ttk.Checkbutton(profile_frame, text="Profile UI", variable=self.profile_var,
+                        command=self.toggle_profiling).pack(side=tk.LEFT, padx=5)
+        ttk.Button(profile_frame, text="Export Profile", command=self.export_profile).pack(side=tk.LEFT, padx=5)
+
+        # Results display
+        self.results_frame = ttk.LabelFrame(control_frame, text="Results")
+        self.results_frame.pack(fill=tk.X)
+
+        self.results_text = tk.Text(self.results_frame, height=5, wrap=tk.WORD)
+        self.results_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        # Canvas for maze display
+        canvas_frame = ttk.Frame(main_frame)
+        canvas_frame.pack(fill=tk.BOTH, expand=True)
+
+        self.canvas = tk.Canvas(canvas_frame, bg='white', scrollregion=(0, 0, 1000, 1000))
+
+        # Scrollbars for canvas
+        v_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        h_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        self.canvas.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        v_scrollbar.grid(row=0, column=1, sticky="ns")
+        h_scrollbar.grid(row=1, column=0, sticky="ew")
+
+        canvas_frame.grid_rowconfigure(0, weight=1)
+        canvas_frame.grid_columnconfigure(0, weight=1)
+
+        # Bind mouse events
+        self.canvas.bind("<Button-1>", self.on_canvas_click)
+        self.canvas.bind("<B1-Motion>", self.on_canvas_drag)
+
+    def stop_animation(self):
+        """Stops any ongoing animation."""
+        self.animation_stop_event.set()
+        self.update_results("Animation stopped.")
+
+    def load_maze(self):
+        """Load a maze from file"""
+        file_path = filedialog.askopenfilename(
+            title="Select Maze File",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+        )
+        if file_path:
+            try:
+                with self.profiler.action("load_maze"):
+                    self.stop_animation()  # Stop any ongoing animation
+                    with self.profiler.action("parse_maze_file"):
+                        self.maze = Maze(file_path)
+                    self.draw_maze()
+                    self.update_results("Maze loaded successfully!")
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to load maze: {str(e)}")
+
+    def save_maze(self):
+        """Save the current maze to file"""
+        if not self.maze:
+            messagebox.showwarning("Warning", "No maze to save!")
+            return
+
+        file_path = filedialog.asksaveasfilename(
+            title="Save Maze As",
+            defaultextension=".txt",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+        )
+        if file_path:
+            try:
+                with self.profiler.action("save_maze"):
+                    self.maze.save_to_file(file_path)
+                    self.update_results("Maze saved successfully!")
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to save maze: {str(e)}")
+
+    def create_new_maze(self):
+        """Create a new empty maze"""
+        dialog = tk.Toplevel(self.master)
+        dialog.title("New Maze")
+        dialog.geometry("300x180")  # Increased height for better layout
+        dialog.transient(self.master)
+        dialog.grab_set()
+
+        ttk.Label(dialog, text="Rows:").pack(pady=5)
+        rows_var = tk.IntVar(value=8)
+        rows_entry = ttk.Entry(dialog, textvariable=rows_var)
+        rows_entry.pack(pady=5)
+
+        ttk.Label(dialog, text="Columns:").pack(pady=5)
+        cols_var = tk.IntVar(value=8)
+        cols_entry = ttk.Entry(dialog, textvariable=cols_var)
+        cols_entry.pack(pady=5)
+
+        def create_maze_action():
+            try:
+                rows = rows_var.get()
+                cols = cols_var.get()
+                if rows <= 0 or cols <= 0:
+                    messagebox.showerror("Input Error", "Rows and columns must be positive integers.")
+                    return
+                with self.profiler.action("create_maze"):
+                    self.stop_animation()  # Stop any ongoing animation
+                    with self.profiler.action("create_empty_maze"):
+                        self.maze = Maze()
+                        self.maze.create_empty_maze(rows, cols)
+                    self.draw_maze()
+                    self.update_results(f"New {rows}x{cols} maze created!")
+                dialog.destroy()
+            except tk.TclError:  # Catch non-integer input
+                messagebox.showerror("Input Error", "Please enter valid integers for rows and columns.")
+
+        ttk.Button(dialog, text="Create", command=create_maze_action).pack(pady=10)
+        # Center the dialog
+        dialog.update_idletasks()
+        x = self.master.winfo_x() + (self.master.winfo_width() // 2) - (dialog.winfo_width() // 2)
+        y = self.master.winfo_y() + (self.master.winfo_height() // 2) - (dialog.winfo_height() // 2)
+        dialog.geometry(f"+{int(x)}+{int(y)}")
+
+    @profiled("solve_dfs")
+    def solve_dfs_threaded(self):
+        """Solve maze using DFS in a separate thread"""
+        if not self.maze:
+            messagebox.showwarning("Warning", "Please load a maze first!")
+            return
+
+        self.stop_animation()  # Stop any ongoing animation
+        self.clear_solution()
+        self.update_results("Solving with DFS...")
+        maze = self.maze
+        snapshot = maze.snapshot()  # Solve on a consistent copy while the user keeps editing
+
+        def run_dfs():
+            solver = MazeSolver(snapshot, cache=self.solve_cache, fast=True)
+            found = solver.dfs()
+            # Schedule the GUI update back on the main thread
+            self.master.after(1, lambda: self._post_solve_dfs(maze, snapshot, solver, found))
+
+        threading.Thread(target=run_dfs, daemon=True).start()  # daemon=True ensures thread exits with main app
+
+    @profiled("show_dfs_result")
+    def _post_solve_dfs(self, maze, snapshot, solver, found):
+        if self._solve_is_stale(maze, snapshot):
+            return
+        self.solver = solver
+        if found:
+            self.draw_solution("DFS", "red")
+            self.update_results(f"DFS Solution - Path Length: {self.solver.get_path_length()}, "
+                                f"Steps Explored: {self.solver.steps_taken}, "
+                                f"Time: {self.solver.solve_time:.4f}s{self._cached_note(self.solver)}\n"
+                                f"{self.solve_cache.stats_text()}")
+        else:
+            self.update_results(f"DFS: No solution found!\n{self.solve_cache.stats_text()}")
+
+    @profiled("solve_bfs")
+    def solve_bfs_threaded(self):
+        """Solve maze using BFS in a separate thread"""
+        if not self.maze:
+            messagebox.showwarning("Warning", "Please load a maze first!")
+            return
+
+        self.stop_animation()  # Stop any ongoing animation
+        self.clear_solution()
+        self.update_results("Solving with BFS...")
+        maze = self.maze
+        snapshot = maze.snapshot()
+
+        def run_bfs():
+            solver = MazeSolver(snapshot, cache=self.solve_cache, fast=True)
+            found = solver.bfs()
+            self.master.after(1, lambda: self._post_solve_bfs(maze, snapshot, solver, found))
+
+        threading.Thread(target=run_bfs, daemon=True).start()
+
+    @profiled("show_bfs_result")
+    def _post_solve_bfs(self, maze, snapshot, solver, found):
+        if self._solve_is_stale(maze, snapshot):
+            return
+        self.solver = solver
+        if found:
+            self.draw_solution("BFS", "blue")
+            self.update_results(f"BFS Solution - Path Length: {self.solver.get_path_length()}, "
+                                f"Steps Explored: {self.solver.steps_taken}, "
+                                f"Time: {self.solver.solve_time:.4f}s{self._cached_note(self.solver)}\n"
+                                f"{self.solve_cache.stats_text()}")
+        else:
+            self.update_results(f"BFS: No solution found!\n{self.solve_cache.stats_text()}")
+
+    @profiled("compare_algorithms")
+    def compare_algorithms_threaded(self):
+        """Compare DFS and BFS algorithms in a separate thread"""
+        if not self.maze:
+            messagebox.showwarning("Warning", "Please load a maze first!")
+            return
+
+        self.stop_animation()  # Stop any ongoing animation
+        self.clear_solution()
+        self.update_results("Comparing DFS and BFS...")
+        maze = self.maze
+        snapshot = maze.snapshot()
+
+        def run_comparison():
+            # Solve with DFS
+            dfs_solver = MazeSolver(snapshot, cache=self.solve_cache, fast=True)
+            dfs_found = dfs_solver.dfs()
+
+            # Solve with BFS
+            bfs_solver = MazeSolver(snapshot, cache=self.solve_cache, fast=True)
+            bfs_found = bfs_solver.bfs()
+
+            self.master.after(1, lambda: self._post_compare_algorithms(maze, snapshot, dfs_solver, bfs_solver,
+                                                                       dfs_found, bfs_found))
+
+        threading.Thread(target=run_comparison, daemon=True).start()
+
+    @profiled("show_comparison")
+    def _post_compare_algorithms(self, maze, snapshot, dfs_solver, bfs_solver, dfs_found, bfs_found):
+        if self._solve_is_stale(maze, snapshot):
+            return
+        # Display both solutions
+        if dfs_found:
+            self.draw_path(dfs_solver.path, "red", "DFS_comp")
+        if bfs_found:
+            self.draw_path(bfs_solver.path, "blue", "BFS_comp")
+
+        # Update results
+        results = "Algorithm Comparison:\n"
+        if dfs_found:
+            results += f"DFS - Length: {dfs_solver.get_path_length()}, Steps: {dfs_solver.steps_taken}, Time: {dfs_solver.solve_time:.4f}s{self._cached_note(dfs_solver)}\n"
+        else:
+            results += "DFS - No solution found\n"
+
+        if bfs_found:
+            results += f"BFS - Length: {bfs_solver.get_path_length()}, Steps: {bfs_solver.steps_taken}, Time: {bfs_solver.solve_time:.4f}s{self._cached_note(bfs_solver)}\n"
+        else:
+            results += "BFS - No solution found\n"
+
+        if dfs_found and bfs_found:
+            if dfs_solver.get_path_length() < bfs_solver.get_path_length():
+                results += "DFS found shorter path!"
+            elif bfs_solver.get_path_length() < dfs_solver.get_path_length():
+                results += "BFS found shorter path!"
+            else:
+                results += "Both algorithms found paths of equal length!"
+
+        results += "\n" + self.solve_cache.stats_text()
+        self.update_results(results)
+
+    def _cached_note(self, solver):
+        """Return a marker for results that came from the solve cache"""
+        return " (cached)" if solver.cache_hit else ""
+
+    @profiled("animate_dfs")
+    def animate_dfs(self):
+        """Animate DFS step by step"""
+        if not self.maze:
+            messagebox.showwarning("Warning", "Please load a maze first!")
+            return
+
+        self.stop_animation()  # Stop any ongoing animation
+        self.clear_solution()
+        self.update_results("Animating DFS...")
+        maze = self.maze
+        snapshot = maze.snapshot()
+        solver = MazeSolver(snapshot, fast=True)
+
+        def run_animate_dfs():
+            found = solver.dfs(step_by_step=True)
+            self.master.after(1, lambda: self._post_animate(maze, snapshot, solver, found, "DFS", "red"))
+
+        threading.Thread(target=run_animate_dfs, daemon=True).start()
+
+    @profiled("animate_bfs")
+    def animate_bfs(self):
+        """Animate BFS step by step"""
+        if not self.maze:
+            messagebox.showwarning("Warning", "Please load a maze first!")
+            return
+
+        self.stop_animation()  # Stop any ongoing animation
+        self.clear_solution()
+        self.update_results("Animating BFS...")
+        maze = self.maze
+        snapshot = maze.snapshot()
+        solver = MazeSolver(snapshot, fast=True)
+
+        def run_animate_bfs():
+            found = solver.bfs(step_by_step=True)
+            self.master.after(1, lambda: self._post_animate(maze, snapshot, solver, found, "BFS", "blue"))
+
+        threading.Thread(target=run_animate_bfs, daemon=True).start()
+
+    def _solve_is_stale(self, maze, snapshot):
+        """Check whether the maze was replaced or edited after the snapshot was taken"""
+        if maze is self.maze and maze.version == snapshot.version:
+            return False
+        self.update_results("Maze changed while solving; result discarded.")
+        return True
+
+    def _post_animate(self, maze, snapshot, solver, found, algorithm, color):
+        if self._solve_is_stale(maze, snapshot):
+            return
+        if not found:
+            self.update_results(f"{algorithm}: No solution found!")
+            return
+        self.solver = solver
+        self.animate_solution(maze, snapshot, algorithm, color)
+
+    @profiled("start_animation")
+    def animate_solution(self, maze, snapshot, algorithm, color):
+        """Animate the step-by-step solution, stopping if the maze is edited or replaced"""
+        self.draw_maze()
+        self.animation_stop_event.clear()  # Reset stop event for new animation
+
+        def animate_step(step_index):
+            with self.profiler.action("animate_step"):
+                if self.animation_stop_event.is_set():  # Check if stop event is set
+                    return
+                if self._solve_is_stale(maze, snapshot):
+                    return
+
+                if step_index >= len(self.solver.exploration_order):
+                    # Animation complete, draw final path
+                    self.draw_path(self.solver.path, color, algorithm)
+                    self.update_results(f"{algorithm} Animation Complete - "
+                                        f"Path Length: {self.solver.get_path_length()}, "
+                                        f"Steps Explored: {self.solver.steps_taken}")
+                    return
+
+                action, cell = self.solver.exploration_order[step_index]
+                row, col = cell
+
+                # Convert canvas coordinates to cell coordinates for drawing
+                x1_rect = col * self.cell_size + 2
+                y1_rect = row * self.cell_size + 2
+                x2_rect = x1_rect + self.cell_size - 4
+                y2_rect = y1_rect + self.cell_size - 4
+
+                # Avoid drawing over entrance/exit text, keep them visible
+                if cell == self.maze.entrance or cell == self.maze.exit:
+                    fill_color = 'lightgreen' if cell == self.maze.entrance else 'pink'
+                elif action == 'visit':
+                    fill_color = 'lightgray'
+                elif action == 'explore':
+                    fill_color = 'lightyellow'
+                else:
+                    fill_color = 'white'  # Default or unknown state
+
+                self.canvas.create_rectangle(x1_rect, y1_rect, x2_rect, y2_rect, fill=fill_color, outline='gray',
+                                             tags='animation')
+
+                # Schedule next step
+                self.master.after(self.speed_var.get(), lambda: animate_step(step_index + 1))
+
+        animate_step(0)
+
+    @profiled("toggle_edit_mode")
+    def toggle_edit_mode(self):
+        """Toggle maze editing mode"""
+        self.is_editing = self.edit_var.get()
+        if self.is_editing:
+            self.canvas.config(cursor="hand2")  # Change cursor to indicate editable area
+            self.update_results("Edit Mode: ON. Click/drag to toggle walls, use radio buttons to set Entrance/Exit.")
+        else:
+            self.canvas.config(cursor="")
+            self.update_results("Edit Mode: OFF.")
+
+    @profiled("canvas_click")
+    def on_canvas_click(self, event):
+        """Handle canvas click events for editing"""
+        if not self.is_editing or not self.maze:
+            return
+
+        # Convert canvas coordinates to maze cell/wall coordinates
+        # Adjust for scroll region offset if necessary, though canvasx/y should handle this.
+        canvas_x = self.canvas.canvasx(event.x)
+        canvas_y = self.canvas.canvasy(event.y)
+
+        col_at_click = int(canvas_x // self.cell_size)
+        row_at_click = int(canvas_y // self.cell_size)
+
+        mode = self.mode_var.get()
+
+        if mode == "entrance":
+            if 0 <= row_at_click < self.maze.rows and 0 <= col_at_click < self.maze.cols:
+                self.maze.set_entrance((row_at_click, col_at_click))
+                self.draw_maze()
+                self.update_results(f"Entrance set to: ({row_at_click},{col_at_click})")
+            else:
+                messagebox.showwarning("Warning", "Cannot set entrance outside maze boundaries.")
+        elif mode == "exit":
+            if 0 <= row_at_click < self.maze.rows and 0 <= col_at_click < self.maze.cols:
+                self.maze.set_exit((row_at_click, col_at_click))
+                self.draw_maze()
+                self.update_results(f"Exit set to: ({row_at_click},{col_at_click})")
+            else:
+                messagebox.showwarning("Warning", "Cannot set exit outside maze boundaries.")
+        elif mode == "wall":
+            self.handle_wall_editing(event)
+
+    @profiled("canvas_drag")
+    def on_canvas_drag(self, event):
+        """Handle canvas drag events for wall editing"""
+        if self.is_editing and self.mode_var.get() == "wall":
+            self.handle_wall_editing(event)
+
+    def handle_wall_editing(self, event):
+        """Handle wall editing"""
+        if not self.maze:
+            return
+
+        x = self.canvas.canvasx(event.x)
+        y = self.canvas.canvasy(event.y)
+
+        # Determine which cell and which part of the cell was clicked
+        col = int(x / self.cell_size)
+        row = int(y / self.cell_size)
+
+        x_in_cell = x % self.cell_size
+        y_in_cell = y % self.cell_size
+
+        wall_toggle_performed = False
+
+        # Tolerance for clicking near a wall
+        tolerance = 5
+
+        # Horizontal walls (top and bottom of a cell)
+        if y_in_cell < tolerance:  # Near top edge of cell (horizontal wall above current cell)
+            if 0 <= row <= self.maze.rows and 0 <= col < self.maze.cols:
+                self.maze.toggle_horizontal_wall(row, col)
+                wall_toggle_performed = True
+        elif y_in_cell > self.cell_size - tolerance:  # Near bottom edge of cell (horizontal wall below current cell)
+            if 0 <= row + 1 <= self.maze.rows and 0 <= col < self.maze.cols:
+                self.maze.toggle_horizontal_wall(row + 1, col)
+                wall_toggle_performed = True
+
+        # Vertical walls (left and right of a cell)
+        if x_in_cell < tolerance:  # Near left edge of cell (vertical wall to the left of current cell)
+            if 0 <= row < self.maze.rows and 0 <= col <= self.maze.cols:
+                self.maze.toggle_vertical_wall(row, col)
+                wall_toggle_performed = True
+        elif x_in_cell > self.cell_size - tolerance:  # Near right edge of cell (vertical wall to the right of current cell)
+            if 0 <= row < self.maze.rows and 0 <= col + 1 <= self.maze.cols:
+                self.maze.toggle_vertical_wall(row, col + 1)
+                wall_toggle_performed = True
+
+        if wall_toggle_performed:
+            self.draw_maze()  # Redraw maze to reflect changes
+            self.clear_solution()  # Clear any existing solution when maze changes
+
+    @profiled("clear_solution")
+    def clear_solution(self):
+        """Clear the current solution display"""
+        self.canvas.delete("solution")
+        self.canvas.delete("animation")
+        self.canvas.delete("DFS_comp")  # Clear comparison paths
+        self.canvas.delete("BFS_comp")  # Clear comparison paths
+        self.update_results("")  # Clear results text
+
+    @profiled("draw_maze")
+    def draw_maze(self):
+        """Draw the maze on canvas"""
+        if not self.maze:
+            return
+
+        self.canvas.delete("all")
+
+        # Draw cells
+        for row in range(self.maze.rows):
+            for col in range(self.maze.cols):
+                x1 = col * self.cell_size
+                y1 = row * self.cell_size
+                x2 = x1 + self.cell_size
+                y2 = y1 + self.cell_size
+
+                # Draw cell background (e.g., light gray border)
+                self.canvas.create_rectangle(x1, y1, x2, y2, fill='white', outline='lightgray')
+
+        # Draw walls
+        # Horizontal walls
+        for row in range(self.maze.rows + 1):
+            for col in range(self.maze.cols):
+                if self.maze.horizontal_walls.get(row, col):
+                    x1 = col * self.cell_size
+                    y1 = row * self.cell_size
+                    x2 = x1 + self.cell_size
+                    y2 = y1
+                    self.canvas.create_line(x1, y1, x2, y2, width=3, fill='black', tags="wall")
+
+        # Vertical walls
+        for row in range(self.maze.rows):
+            for col in range(self.maze.cols + 1):
+                if self.maze.vertical_walls.get(row, col):
+                    x1 = col * self.cell_size
+                    y1 = row * self.cell_size
+                    x2 = x1
+                    y2 = y1 + self.cell_size
+                    self.canvas.create_line(x1, y1, x2, y2, width=3, fill='black', tags="wall")
+
+        # Mark entrance and exit (draw these *after* walls to ensure they are on top)
+        if self.maze.entrance:
+            r, c = self.maze.entrance
+            x_center = c * self.cell_size + self.cell_size // 2
+            y_center = r * self.cell_size + self.cell_size // 2
+            self.canvas.create_oval(x_center - 10, y_center - 10, x_center + 10, y_center + 10,
+                                    fill='green', outline='darkgreen', tags="entrance_exit")
+            self.canvas.create_text(x_center, y_center, text='A', font=('Arial', 10, 'bold'),
+                                    fill='white', tags="entrance_exit_text")
+        if self.maze.exit:
+            r, c = self.maze.exit
+            x_center = c * self.cell_size + self.cell_size // 2
+            y_center = r * self.cell_size + self.cell_size // 2
+            self.canvas.create_oval(x_center - 10, y_center - 10, x_center + 10, y_center + 10,
+                                    fill='red', outline='darkred', tags="entrance_exit")
+            self.canvas.create_text(x_center, y_center, text='B', font=('Arial', 10, 'bold'),
+                                    fill='white', tags="entrance_exit_text")
+
+        # Update scroll region
+        self.canvas.config(scrollregion=(0, 0, self.maze.cols * self.cell_size, self.maze.rows * self.cell_size))
+
+    @profiled("draw_path")
+    def draw_path(self, path, color, tag_suffix):
+        """Draw a path on the canvas"""
+        if not path:
+            return
+
+        for i in range(len(path) - 1):
+            r1, c1 = path[i]
+            r2, c2 = path[i + 1]
+
+            x1_center = c1 * self.cell_size + self.cell_size // 2
+            y1_center = r1 * self.cell_size + self.cell_size // 2
+            x2_center = c2 * self.cell_size + self.cell_size // 2
+            y2_center = r2 * self.cell_size + self.cell_size // 2
+
+            self.canvas.create_line(x1_center, y1_center, x2_center, y2_center,
+                                    fill=color, width=4, tags=("solution", tag_suffix))
+
+    def draw_solution(self, algorithm, color):
+        """Draw the solution path"""
+        self.clear_solution()
+        if self.solver and self.solver.path:
+            self.draw_path(self.solver.path, color, algorithm)
+
+    def toggle_profiling(self):
+        """Start or stop recording UI actions and event-loop frame times"""
+        if self.profile_var.get():
+            self.profiler.start(self.master)
+            self.update_results("Profiling: ON. Use the app, then export the profile.")
+        else:
+            self.profiler.stop()
+            self.update_results("Profiling: OFF.")
+
+    def export_profile(self):
+        """Export collapsed stacks and the per-action latency table to a directory"""
+        if not self.profiler.stacks and not self.profiler.action_times:
+            messagebox.showwarning("Warning", "No profile recorded yet. Enable Profile UI first.")
+            return
+
+        directory = filedialog.askdirectory(title="Export Profile To")
+        if directory:
+            try:
+                folded_path, table_path = self.profiler.export(directory)
+                self.update_results(f"Profile exported:\n{folded_path}\n{table_path}")
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to export profile: {str(e)}")
+
+    def update_results(self, text):
+        """Update the results text display"""
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, text)
+
+
+def main():
+    root = tk.Tk()
+    app = MazeVisualizer(root)
+    root.mainloop()
+
+
+# Main application entry point
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Sampling profiler for GUI interactions.
+
+UIProfiler samples the Tk (main) thread's Python stack from a background
+thread, tags every sample with the user action running at the time, times
+each action, and measures how late the Tk event loop runs a periodic
+heartbeat (the frame time). Results export as a collapsed-stack file for
+flame graph tools and a plain-text latency table.
+"""
+import functools
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+def profiled(action):
+    """Decorate a MazeVisualizer method so it is timed and sampled as a named action"""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.profiler.action(action):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def _percentile(values, fraction):
+    """Return the value at a fraction (0..1) of the sorted values"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class UIProfiler:
+    def __init__(self, sample_interval=0.002, frame_interval_ms=16, stall_ms=50):
+        """Initialize a disabled profiler; call start() to begin recording"""
+        self.sample_interval = sample_interval
+        self.frame_interval_ms = frame_interval_ms  # Heartbeat period scheduled with after()
+        self.stall_ms = stall_ms  # Frame lateness counted as a stall
+        self.enabled = False
+
+        self.stacks = {}  # Collapsed stack -> sample count
+        self.action_times = {}  # Action name -> list of durations (seconds)
+        self.frame_delays = []  # Heartbeat lateness (ms)
+
+        self._lock = threading.Lock()
+        self._actions = []  # Actions currently running on the main thread, outermost first
+        self._main_thread_id = threading.main_thread().ident
+        self._sampler = None
+        self._master = None
+        self._heartbeat_id = None
+        self._heartbeat_due = 0.0
+
+    def start(self, master):
+        """Clear previous results and start sampling and the frame heartbeat on a Tk widget"""
+        if self.enabled:
+            return
+        with self._lock:
+            self.stacks = {}
+            self.action_times = {}
+            self.frame_delays = []
+        self.enabled = True
+        self._master = master
+        self._sampler = threading.Thread(target=self._sample_loop, daemon=True)
+        self._sampler.start()
+        self._schedule_heartbeat()
+
+    def stop(self):
+        """Stop recording; collected results stay available for export"""
+        if not self.enabled:
+            return
+        self.enabled = False
+        if self._heartbeat_id is not None:
+            self._master.after_cancel(self._heartbeat_id)
+            self._heartbeat_id = None
+        self._sampler.join()
+        self._sampler = None
+
+    @contextmanager
+    def action(self, name):
+        """Time a user action and tag stack samples taken while it runs"""
+        if not self.enabled:
+            yield
+            return
+        self._actions.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._actions.pop()
+            with self._lock:
+                self.action_times.setdefault(name, []).append(elapsed)
+
+    def _schedule_heartbeat(self):
+        self._heartbeat_due = time.perf_counter() + self.frame_interval_ms / 1000
+        self._heartbeat_id = self._master.after(self.frame_interval_ms, self._heartbeat)
+
+    def _heartbeat(self):
+        """Record how late the event loop ran this callback, then schedule the next one"""
+        if not self.enabled:
+            return
+        delay_ms = max(0.0, (time.perf_counter() - self._heartbeat_due) * 1000)
+        with self._lock:
+            self.frame_delays.append(delay_ms)
+        self._schedule_heartbeat()
+
+    def _sample_loop(self):
+        """Sample the main thread's stack until stopped"""
+        while self.enabled:
+            frame = sys._current_frames().get(self._main_thread_id)
+            if frame is not None:
+                frames = []
+                while frame is not None:
+                    code = frame.f_code
+                    frames.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                    frame = frame.f_back
+                frames.reverse()
+                actions = list(self._actions)
+                root = actions[0] if actions else "(event loop)"
+                stack = ";".join([root] + frames)
+                with self._lock:
+                    self.stacks[stack] = self.stacks.get(stack, 0) + 1
+            time.sleep(self.sample_interval)
+
+    def latency_table(self):
+        """Return per-action latencies and frame-time statistics as aligned text"""
+        with self._lock:
+            action_times = {name: list(times) for name, times in self.action_times.items()}
+            frame_delays = list(self.frame_delays)
+
+        lines = [f"{'action':<24}{'count':>7}{'total ms':>11}{'mean ms':>10}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}"]
+        for name, times in sorted(action_times.items(), key=lambda item: -sum(item[1])):
+            ms = [t * 1000 for t in times]
+            lines.append(f"{name:<24}{len(ms):>7}{sum(ms):>11.2f}{sum(ms) / len(ms):>10.2f}"
+                         f"{_percentile(ms, 0.5):>9.2f}{_percentile(ms, 0.95):>9.2f}{max(ms):>9.2f}")
+
+        lines.append("")
+        if frame_delays:
+            stalls = sum(1 for delay in frame_delays if delay >= self.stall_ms)
+            lines.append(f"Event loop: {len(frame_delays)} frames every {self.frame_interval_ms} ms, "
+                         f"lateness p50 {_percentile(frame_delays, 0.5):.2f} ms, "
+                         f"p95 {_percentile(frame_delays, 0.95):.2f} ms, max {max(frame_delays):.2f} ms, "
+                         f"{stalls} stalls >= {self.stall_ms} ms")
+        else:
+            lines.append("Event loop: no frames recorded")
+        return "\n".join(lines) + "\n"
+
+    def export(self, directory):
+        """Write profile.folded (collapsed stacks) and latency.txt into a directory; return their paths"""
+        os.makedirs(directory, exist_ok=True)
+        folded_path = os.path.join(directory, "profile.folded")
+        table_path = os.path.join(directory, "latency.txt")
+
+        with self._lock:
+            stacks = dict(self.stacks)
+        with open(folded_path, 'w') as file:
+            for stack, count in sorted(stacks.items()):
+                file.write(f"{stack} {count}\n")
+        with open(table_path, 'w') as file:
+            file.write(self.latency_table())
+        return folded_path, table_path
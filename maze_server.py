@@ -0,0 +1,345 @@
+"""Local maze solving service.
+
+Run with ``python maze_server.py --port 8765`` (or ``--unix /path/to.sock``).
+
+POST /solve?algorithm=bfs|dfs with the maze in the text file format
+(any Content-Type) or the binary format from Maze.to_bytes
+(Content-Type: application/octet-stream). The reply is JSON with the path.
+GET /metrics returns request latency histograms, queue depth and
+throughput in the Prometheus text format.
+
+Connections are HTTP/1.1 keep-alive and may pipeline requests; replies are
+written in request order. Expect: 100-continue is answered once the body
+is wanted, so clients such as curl do not stall before sending it.
+Solving runs in a process pool.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+
+from maze_core import Maze, MazeSolver, SolveCache
+
+ALGORITHMS = ("bfs", "dfs")
+ROUTES = ("/solve", "/metrics")
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           411: "Length Required", 413: "Payload Too Large", 417: "Expectation Failed",
+           500: "Internal Server Error"}
+CONTINUE = b"HTTP/1.1 100 Continue\r\n\r\n"  # Interim reply for Expect: 100-continue
+
+_worker_cache = None
+
+
+def _init_worker(cache_dir):
+    """Give each pool process its own solve cache (sharing the on-disk tier if one is set)"""
+    global _worker_cache
+    _worker_cache = SolveCache(cache_dir=cache_dir)
+
+
+def solve_payload(payload, binary, algorithm):
+    """Parse a maze payload and solve it; runs inside a pool process"""
+    maze = Maze()
+    if binary:
+        maze.parse_maze_bytes(payload)
+    else:
+        maze.parse_maze_text(payload.decode('utf-8'))
+
+    solver = MazeSolver(maze, cache=_worker_cache, fast=True)
+    found = solver.dfs() if algorithm == "dfs" else solver.bfs()
+    return {
+        "algorithm": algorithm,
+        "found": found,
+        "path": [list(cell) for cell in solver.path],
+        "path_length": solver.get_path_length(),
+        "steps_taken": solver.steps_taken,
+        "solve_time": solver.solve_time,
+        "cached": solver.cache_hit,
+    }
+
+
+class BadRequest(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class ServerMetrics:
+    def __init__(self):
+        """Initialize counters, gauges and latency histograms"""
+        self.start_time = time.time()
+        self.requests = {}  # (route, status) -> count
+        self.latency_counts = {}  # route -> per-bucket counts (last slot is +Inf)
+        self.latency_sums = {}
+        self.queue_depth = 0  # Solves waiting for a pool slot
+        self.in_flight = 0  # Solves running in the pool
+        self.open_connections = 0
+
+    def observe(self, route, status, seconds):
+        """Record one finished request"""
+        self.requests[(route, status)] = self.requests.get((route, status), 0) + 1
+        counts = self.latency_counts.setdefault(route, [0] * (len(LATENCY_BUCKETS) + 1))
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                counts[i] += 1
+                break
+        else:
+            counts[-1] += 1
+        self.latency_sums[route] = self.latency_sums.get(route, 0.0) + seconds
+
+    def render(self):
+        """Return the metrics in the Prometheus text exposition format"""
+        uptime = time.time() - self.start_time
+        total = sum(self.requests.values())
+        lines = [
+            "# TYPE maze_requests_total counter",
+        ]
+        for (route, status), count in sorted(self.requests.items()):
+            lines.append(f'maze_requests_total{{route="{route}",status="{status}"}} {count}')
+
+        lines.append("# TYPE maze_request_seconds histogram")
+        for route, counts in sorted(self.latency_counts.items()):
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, counts):
+                cumulative += count
+                lines.append(f'maze_request_seconds_bucket{{route="{route}",le="{bound}"}} {cumulative}')
+            cumulative += counts[-1]
+            lines.append(f'maze_request_seconds_bucket{{route="{route}",le="+Inf"}} {cumulative}')
+            lines.append(f'maze_request_seconds_sum{{route="{route}"}} {self.latency_sums[route]:.6f}')
+            lines.append(f'maze_request_seconds_count{{route="{route}"}} {cumulative}')
+
+        lines += [
+            "# TYPE maze_queue_depth gauge",
+            f"maze_queue_depth {self.queue_depth}",
+            "# TYPE maze_solves_in_flight gauge",
+            f"maze_solves_in_flight {self.in_flight}",
+            "# TYPE maze_open_connections gauge",
+            f"maze_open_connections {self.open_connections}",
+            "# TYPE maze_uptime_seconds gauge",
+            f"maze_uptime_seconds {uptime:.3f}",
+            "# TYPE maze_throughput_requests_per_second gauge",
+            f"maze_throughput_requests_per_second {total / uptime if uptime > 0 else 0.0:.3f}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class MazeServer:
+    def __init__(self, workers=None, cache_dir=None, max_pending=None, pipeline_depth=16,
+                 max_body=64 * 1024 * 1024, keep_alive_timeout=30.0):
+        """Initialize the service; max_pending bounds solves submitted to the pool at once"""
+        # Spawned rather than forked: workers start lazily and would otherwise inherit client sockets,
+        # keeping connections open after the server closes them
+        self.pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                        initializer=_init_worker, initargs=(cache_dir,))
+        self.max_pending = max_pending or 2 * (workers or os.cpu_count() or 1)
+        self.pipeline_depth = pipeline_depth  # Requests read ahead per connection before reading pauses
+        self.max_body = max_body
+        self.keep_alive_timeout = keep_alive_timeout
+        self.metrics = ServerMetrics()
+        self._slots = None  # Created on the serving loop
+
+    async def serve(self, host="127.0.0.1", port=8765, unix_path=None):
+        """Listen on TCP or a Unix socket until cancelled"""
+        self._slots = asyncio.Semaphore(self.max_pending)
+        if unix_path:
+            server = await asyncio.start_unix_server(self._handle_connection, path=unix_path)
+        else:
+            server = await asyncio.start_server(self._handle_connection, host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+
+    async def _handle_connection(self, reader, writer):
+        """Read pipelined requests and hand them to the writer in order.
+
+        Each request is dispatched as soon as it is parsed. Once pipeline_depth
+        replies are outstanding the reader stops reading from the socket, which
+        pushes back on the client through TCP flow control.
+        """
+        self.metrics.open_connections += 1
+        replies = asyncio.Queue(maxsize=self.pipeline_depth)
+        writer_task = asyncio.create_task(self._write_replies(replies, writer))
+        try:
+            while not writer_task.done():
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader, replies), self.keep_alive_timeout)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except BadRequest as e:
+                    await replies.put((self._error_reply(e.status, str(e)), "bad_request", time.time(), False))
+                    break
+                if request is None:
+                    break
+
+                method, target, headers, body, keep_alive = request
+                task = asyncio.ensure_future(self._dispatch(method, target, headers, body))
+                route = urlsplit(target).path
+                await replies.put((task, route if route in ROUTES else "other", time.time(), keep_alive))
+                if not keep_alive:
+                    break
+        finally:
+            await replies.put(None)
+            await writer_task
+            self.metrics.open_connections -= 1
+
+    async def _write_replies(self, replies, writer):
+        """Write replies in request order, waiting for the socket to drain after each"""
+        try:
+            while True:
+                item = await replies.get()
+                if item is None:
+                    break
+                if item is CONTINUE:
+                    writer.write(CONTINUE)
+                    await writer.drain()
+                    continue
+                reply, route, started, keep_alive = item
+                status, content_type, body = await reply if asyncio.isfuture(reply) else reply
+                self.metrics.observe(route, status, time.time() - started)
+
+                head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                        f"Content-Type: {content_type}\r\n"
+                        f"Content-Length: {len(body)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+                writer.write(head.encode('latin-1') + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            # Drop replies nobody will read so the reader is never stuck on a full queue
+            while not replies.empty():
+                item = replies.get_nowait()
+                if item is not None and item is not CONTINUE and asyncio.isfuture(item[0]):
+                    item[0].cancel()
+
+    async def _read_request(self, reader, replies):
+        """Read one request; return None on a clean end of stream
+
+        A 100 Continue for Expect: 100-continue goes through the replies queue so
+        it is written after the replies to earlier pipelined requests.
+        """
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as e:
+            if not e.partial.strip():
+                return None
+            raise BadRequest(400, "Truncated request")
+        except asyncio.LimitOverrunError:
+            raise BadRequest(400, "Request head too large")
+
+        lines = head.decode('latin-1').split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ")
+        except ValueError:
+            raise BadRequest(400, "Malformed request line")
+
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+
+        expect = headers.get("expect", "").lower()
+        if expect and expect != "100-continue":
+            raise BadRequest(417, f"Unsupported expectation: {expect}")
+
+        body = b""
+        if "content-length" in headers:
+            try:
+                length = int(headers["content-length"])
+            except ValueError:
+                raise BadRequest(400, "Invalid Content-Length")
+            if length > self.max_body:
+                raise BadRequest(413, "Maze payload too large")
+            if expect and length:
+                await replies.put(CONTINUE)
+            body = await reader.readexactly(length)
+        elif method == "POST":
+            raise BadRequest(411, "Content-Length required")
+        return method, target, headers, body, keep_alive
+
+    async def _dispatch(self, method, target, headers, body):
+        """Route a request and return (status, content type, body bytes)"""
+        url = urlsplit(target)
+        try:
+            if url.path == "/metrics":
+                if method != "GET":
+                    return self._error_reply(405, "Use GET")
+                return 200, "text/plain; version=0.0.4", self.metrics.render().encode()
+            if url.path == "/solve":
+                if method != "POST":
+                    return self._error_reply(405, "Use POST")
+                algorithm = parse_qs(url.query).get("algorithm", ["bfs"])[0].lower()
+                if algorithm not in ALGORITHMS:
+                    return self._error_reply(400, f"Unknown algorithm: {algorithm}")
+                binary = headers.get("content-type", "").startswith("application/octet-stream")
+                result = await self._solve(body, binary, algorithm)
+                return 200, "application/json", json.dumps(result).encode()
+            return self._error_reply(404, f"No route for {url.path}")
+        except (ValueError, IndexError, UnicodeDecodeError) as e:
+            return self._error_reply(400, f"Invalid maze payload: {e}")
+        except Exception as e:
+            return self._error_reply(500, str(e))
+
+    async def _solve(self, body, binary, algorithm):
+        """Run a solve in the process pool once a slot is free"""
+        self.metrics.queue_depth += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.metrics.queue_depth -= 1
+        self.metrics.in_flight += 1
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self.pool, solve_payload, body, binary, algorithm)
+        except BaseException:
+            self._release_slot(None)
+            raise
+        # Cancelling this request (the client went away) does not stop a running solve, so the
+        # slot is held until the pool finishes it; shield keeps the cancel from reaching the future
+        future.add_done_callback(self._release_slot)
+        return await asyncio.shield(future)
+
+    def _release_slot(self, future):
+        """Free a pool slot once its solve is done, retrieving any error nobody awaited"""
+        self.metrics.in_flight -= 1
+        self._slots.release()
+        if future is not None and not future.cancelled():
+            future.exception()
+
+    @staticmethod
+    def _error_reply(status, message):
+        """Build a JSON error reply"""
+        return status, "application/json", json.dumps({"error": message}).encode()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve maze solving over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Listen on this Unix socket path instead of TCP")
+    parser.add_argument("--workers", type=int, help="Solver processes (default: CPU count)")
+    parser.add_argument("--cache-dir", help="Directory for the on-disk solve cache")
+    parser.add_argument("--max-pending", type=int, help="Solves allowed in the pool at once")
+    args = parser.parse_args(argv)
+
+    server = MazeServer(workers=args.workers, cache_dir=args.cache_dir, max_pending=args.max_pending)
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()